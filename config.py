@@ -1,14 +1,29 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load .env from repository root (if present)
 ROOT = Path(__file__).resolve().parent
-load_dotenv(ROOT / ".env")
+
+# Opt-in: read values from config_frozen.py (see tools/freeze_config.py) instead of .env
+FROZEN_CONFIG_FLAG = "AUTOTUBE_FROZEN_CONFIG"
+
+@lru_cache(maxsize=None)
+def _load():
+    """Load .env from repository root (if present) and snapshot the environment."""
+    if os.environ.get(FROZEN_CONFIG_FLAG) == "1":
+        try:
+            from config_frozen import ENV
+        except ImportError:
+            pass
+        else:
+            # Real environment variables win, as with load_dotenv()
+            return {**ENV, **os.environ}
+    from dotenv import load_dotenv
+    load_dotenv(ROOT / ".env")
+    return dict(os.environ)
 
 def getenv(key, default=None):
-    val = os.getenv(key)
-    return val if val is not None else default
+    return _load().get(key, default)
 
 # Google / Gemini
 GOOGLE_API_KEY = getenv("GOOGLE_API_KEY")
@@ -34,20 +49,24 @@ FACEBOOK_ACCESS_TOKEN = getenv("FACEBOOK_ACCESS_TOKEN")
 LINKEDIN_ACCESS_TOKEN = getenv("LINKEDIN_ACCESS_TOKEN")
 
 # App defaults
-OUTPUT_DIR = getenv("OUTPUT_DIR", str(ROOT / "outputs"))
+OUTPUT_DIR = Path(getenv("OUTPUT_DIR", ROOT / "outputs"))
 YOUTUBE_URL_DEFAULT = getenv("YOUTUBE_URL", "")
+PROMPT_TYPE_DEFAULT = getenv("PROMPT_TYPE", "transcript")
+
+_CONFIG = {
+    "GOOGLE_API_KEY": GOOGLE_API_KEY,
+    "DEFAULT_MODEL": DEFAULT_MODEL,
+    "OPENAI_API_KEY": OPENAI_API_KEY,
+    "GMAIL_ADDRESS": GMAIL_ADDRESS,
+    "IMGBB_API_KEY": IMGBB_API_KEY,
+    "TELEGRAM_CHAT_ID": TELEGRAM_CHAT_ID,
+    "TWITTER_BEARER_TOKEN": TWITTER_BEARER_TOKEN,
+    "FACEBOOK_ACCESS_TOKEN": FACEBOOK_ACCESS_TOKEN,
+    "LINKEDIN_ACCESS_TOKEN": LINKEDIN_ACCESS_TOKEN,
+    "OUTPUT_DIR": OUTPUT_DIR,
+    "YOUTUBE_URL_DEFAULT": YOUTUBE_URL_DEFAULT,
+    "PROMPT_TYPE_DEFAULT": PROMPT_TYPE_DEFAULT,
+}
 
 def as_dict():
-    return {
-        "GOOGLE_API_KEY": GOOGLE_API_KEY,
-        "DEFAULT_MODEL": DEFAULT_MODEL,
-        "OPENAI_API_KEY": OPENAI_API_KEY,
-        "GMAIL_ADDRESS": GMAIL_ADDRESS,
-        "IMGBB_API_KEY": IMGBB_API_KEY,
-        "TELEGRAM_CHAT_ID": TELEGRAM_CHAT_ID,
-        "TWITTER_BEARER_TOKEN": TWITTER_BEARER_TOKEN,
-        "FACEBOOK_ACCESS_TOKEN": FACEBOOK_ACCESS_TOKEN,
-        "LINKEDIN_ACCESS_TOKEN": LINKEDIN_ACCESS_TOKEN,
-        "OUTPUT_DIR": OUTPUT_DIR,
-        "YOUTUBE_URL_DEFAULT": YOUTUBE_URL_DEFAULT,
-    }
+    return _CONFIG.copy()
@@ -20,21 +20,21 @@ Or set defaults in a .env file and run:
 import os
 import sys
 import json
-import argparse
-from typing import Dict, Any
-import requests
-from dotenv import load_dotenv
-from datetime import datetime
+import time
+import hashlib
+from functools import cache
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Any, List, Optional, Tuple
+from pathlib import Path
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used otherwise
+    orjson = None
 
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gemini-1.5-flash")
-OUTPUT_DIR = os.getenv("OUTPUT_DIR", "outputs")
-DEFAULT_YOUTUBE_URL = os.getenv("YOUTUBE_URL", "")
-DEFAULT_PROMPT_TYPE = os.getenv("PROMPT_TYPE", "transcript")
 
-PROMPTS = {
+# Read-only; adjacent string literals below are joined by the compiler, not at runtime
+PROMPTS = MappingProxyType({
     "scene": (
         "Please provide a detailed description of the scene in the video, including:\n\n"
         "Setting: Where the scene takes place (e.g., indoors, outdoors, specific location). Be specific - is it a forest, a city street, a living room?\n\n"
@@ -64,7 +64,83 @@ PROMPTS = {
     "fallback": (
         "Summarize this YouTube video with a focus on actionable insights. Use nested bullets and include relevant quotes. Specifically, highlight any recommended tools, strategies, or resources mentioned."
     ),
-}
+})
+_PROMPT_KEYS = tuple(PROMPTS)
+
+# Upper bound on concurrent generateContent calls in --urls-file mode
+BATCH_WORKERS = 4
+
+# Cached responses under OUTPUT_DIR/.cache are reused for this long
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Output directories already created in this process (saves a stat per save)
+_OUTPUT_DIR_READY = set()
+
+
+@cache
+def _session():
+    """One session per process so repeated calls reuse the TCP/TLS connection."""
+    # requests pulls in urllib3/certifi/charset-normalizer; only pay for it when calling the API
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Every request body is pre-encoded JSON bytes (see encode_payload)
+    session.headers["Content-Type"] = "application/json"
+    # All traffic goes to one host: a single pool holding one keep-alive connection per batch
+    # worker, blocking rather than opening throwaway sockets when every connection is busy
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=BATCH_WORKERS,
+            pool_block=True,
+            # generateContent is slow, billed and not idempotent: retry only connect errors and
+            # 429/503 (request rejected before processing). 500/502/504 may arrive after the
+            # generation already ran, and read timeouts are never replayed.
+            max_retries=Retry(
+                total=3,
+                read=0,
+                other=0,
+                backoff_factor=0.5,
+                status_forcelist=[429, 503],
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Encode to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if pretty else 0
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def apply_env_defaults(args) -> None:
+    """Fill in any option not given on the command line from config.py (environment / .env)."""
+    # Imported here so --help never pays for loading .env
+    import config
+
+    if not args.youtube_url:
+        args.youtube_url = config.YOUTUBE_URL_DEFAULT
+    if not args.prompt_type:
+        args.prompt_type = config.PROMPT_TYPE_DEFAULT
+    if not args.model:
+        args.model = config.DEFAULT_MODEL
+    if not args.api_key:
+        args.api_key = config.GOOGLE_API_KEY
+    args.output_dir = config.OUTPUT_DIR
 
 
 def build_payload(model: str, prompt_text: str, youtube_url: str) -> Dict[str, Any]:
@@ -81,23 +157,54 @@ def build_payload(model: str, prompt_text: str, youtube_url: str) -> Dict[str, A
     }
 
 
-def call_google_generate(model: str, api_key: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Call the Google Generative Language generateContent endpoint."""
+# JSON-encoded prompt text per prompt type, escaped once at import
+_PROMPT_ENCODED = MappingProxyType({
+    prompt_type: _json_dumps(prompt_text) for prompt_type, prompt_text in PROMPTS.items()
+})
+
+# build_payload's encoded shape, split around its two variable leaves (prompt text, URL)
+_PROMPT_MARK = "__PROMPT__"
+_URL_MARK = "__URL__"
+_PAYLOAD_HEAD, _PAYLOAD_REST = _json_dumps(build_payload("", _PROMPT_MARK, _URL_MARK)).split(_json_dumps(_PROMPT_MARK))
+_PAYLOAD_MID, _PAYLOAD_TAIL = _PAYLOAD_REST.split(_json_dumps(_URL_MARK))
+
+
+def encode_payload(prompt_type: str, youtube_url: str) -> bytes:
+    """Return the JSON request body for prompt_type/youtube_url, ready to POST."""
+    return b"".join((
+        _PAYLOAD_HEAD, _PROMPT_ENCODED[prompt_type], _PAYLOAD_MID, _json_dumps(youtube_url), _PAYLOAD_TAIL
+    ))
+
+
+def call_google_generate(model: str, api_key: str, body: bytes) -> Dict[str, Any]:
+    """Call the Google Generative Language generateContent endpoint with a JSON-encoded body."""
     if not api_key:
         raise ValueError("Google API key not set (GOOGLE_API_KEY).")
     url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
-    headers = {"Content-Type": "application/json"}
-    resp = requests.post(url, headers=headers, json=payload, timeout=120)
+    import requests
+
+    resp = _session().post(url, data=body, timeout=120)
+    # Read the response body once and parse the raw bytes directly (no str decode step)
+    resp_body = resp.content
     try:
         resp.raise_for_status()
     except requests.HTTPError as exc:
         # If Google returns a JSON body with error details, try to include them
         try:
-            err = resp.json()
-        except Exception:
-            err = {"status_code": resp.status_code, "text": resp.text}
+            err = _json_loads(resp_body)
+        except ValueError:
+            err = {"status_code": resp.status_code, "text": resp_body.decode("utf-8", "replace")}
         raise RuntimeError(f"Google API error: {err}") from exc
-    return resp.json()
+    return _json_loads(resp_body)
+
+
+def _candidate_text(response_json: Dict[str, Any]) -> Optional[str]:
+    """Return candidates[0].content.parts[0].text, or None if the response has no such text."""
+    # Typical GL responses contain candidates -> content -> parts
+    try:
+        return response_json["candidates"][0]["content"]["parts"][0]["text"]
+    except (KeyError, IndexError, TypeError):
+        return None
 
 
 def extract_main_text(response_json: Dict[str, Any]) -> str:
@@ -105,70 +212,220 @@ def extract_main_text(response_json: Dict[str, Any]) -> str:
     Attempt to extract the generated text similarly to the Set Fields node in the workflow:
     - candidates[0].content.parts[0].text or first available textual field.
     """
-    # Typical GL responses contain candidates -> content -> parts
+    text = _candidate_text(response_json)
+    if text is not None:
+        return text
+    # Fallback to stringifying the whole response
+    return _json_dumps(response_json, pretty=True).decode("utf-8")
+
+
+def _ensure_dir(path: Path) -> None:
+    if path not in _OUTPUT_DIR_READY:
+        path.mkdir(parents=True, exist_ok=True)
+        _OUTPUT_DIR_READY.add(path)
+
+
+def _cache_path(cache_dir: Path, model: str, prompt_type: str, youtube_url: str) -> Path:
+    key = hashlib.blake2b(f"{model}\0{prompt_type}\0{youtube_url}\0".encode("utf-8"), digest_size=16)
+    # Include the prompt text itself so editing a PROMPTS entry invalidates its old results
+    key.update(_PROMPT_ENCODED[prompt_type])
+    return cache_dir / (key.hexdigest() + ".txt")
+
+
+def _read_cache(path: Path) -> Optional[str]:
+    """Return the cached text at path if it exists and is younger than CACHE_TTL_SECONDS."""
     try:
-        candidates = response_json.get("candidates")
-        if candidates and len(candidates) > 0:
-            parts = candidates[0].get("content", {}).get("parts", [])
-            if parts and len(parts) > 0 and "text" in parts[0]:
-                return parts[0]["text"]
-    except Exception:
+        if time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS:
+            return path.read_bytes().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        # Missing, unreadable or corrupt entries are just cache misses
         pass
-    # Fallback to stringifying the whole response
-    return json.dumps(response_json, indent=2, ensure_ascii=False)
+    return None
 
 
-def save_output(out_text: str, prompt_type: str, out_dir: str) -> str:
-    os.makedirs(out_dir, exist_ok=True)
-    timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    filename = f"{timestamp}_{prompt_type}.txt"
-    path = os.path.join(out_dir, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(out_text)
+def _write_cache(path: Path, out_text: str) -> None:
+    """Write out_text to path atomically so readers never see a partial file."""
+    import tempfile
+
+    _ensure_dir(path.parent)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(out_text.encode("utf-8"))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def generate_text(
+    model: str, api_key: str, prompt_type: str, youtube_url: str, cache_dir: Optional[Path] = None
+) -> str:
+    """
+    Run one prompt against one YouTube URL and return the extracted text.
+    With cache_dir set, a result from the last CACHE_TTL_SECONDS is reused instead of calling the API.
+    """
+    if cache_dir:
+        path = _cache_path(cache_dir, model, prompt_type, youtube_url)
+        cached = _read_cache(path)
+        if cached is not None:
+            return cached
+    body = encode_payload(prompt_type, youtube_url)
+    response_json = call_google_generate(model, api_key, body)
+    out_text = _candidate_text(response_json)
+    if out_text is None:
+        # Blocked/empty response: show the fallback dump but never cache it
+        return extract_main_text(response_json)
+    if cache_dir:
+        # Best-effort: a cache problem must never lose a paid, successful generation
+        try:
+            _write_cache(path, out_text)
+        except OSError as e:
+            print(f"Warning: could not write response cache {path}: {e}", file=sys.stderr)
+    return out_text
+
+
+def read_urls_file(path: str) -> List[str]:
+    """Read one URL per line, skipping blank lines and '#' comments."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith("#")]
+
+
+def run_batch(
+    urls: List[str], model: str, api_key: str, prompt_type: str, cache_dir: Optional[Path] = None
+) -> List[Tuple[str, Optional[str], Optional[Exception]]]:
+    """
+    Process many URLs concurrently over the shared session.
+    Returns (url, text, error) per URL in input order; exactly one of text/error is set.
+    """
+    # Only batch mode needs threads; keep concurrent.futures off the single-URL start-up path
+    from concurrent.futures import ThreadPoolExecutor
+
+    _session()  # create the shared session before the workers race to build it
+    with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(urls))) as pool:
+        futures = [pool.submit(generate_text, model, api_key, prompt_type, url, cache_dir) for url in urls]
+    results = []
+    for url, future in zip(urls, futures):
+        try:
+            results.append((url, future.result(), None))
+        except Exception as e:
+            results.append((url, None, e))
+    return results
+
+
+def save_output(out_text: str, prompt_type: str, out_dir: Path, index: Optional[int] = None) -> Path:
+    _ensure_dir(out_dir)
+    from datetime import datetime, timezone
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    suffix = f"_{index:03d}" if index is not None else ""
+    filename = f"{timestamp}_{prompt_type}{suffix}.txt"
+    path = out_dir / filename
+    path.write_bytes(out_text.encode("utf-8"))
     return path
 
 
-def parse_args():
+@cache
+def _parser():
+    """Build the CLI parser once; reused by every parse_args() call in the process."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="YouTube → Generative Language processing")
-    parser.add_argument("--youtube-url", "-y", default=DEFAULT_YOUTUBE_URL, help="Public YouTube URL to analyze")
-    parser.add_argument("--prompt-type", "-p", default=DEFAULT_PROMPT_TYPE, choices=list(PROMPTS.keys()), help="Prompt type to run")
-    parser.add_argument("--model", "-m", default=DEFAULT_MODEL, help="Model name to call (default from env)")
+    parser.add_argument("--youtube-url", "-y", help="Public YouTube URL to analyze (default: YOUTUBE_URL)")
+    parser.add_argument("--prompt-type", "-p", choices=_PROMPT_KEYS, help="Prompt type to run (default: PROMPT_TYPE or transcript)")
+    parser.add_argument("--model", "-m", help="Model name to call (default from env)")
+    parser.add_argument("--urls-file", help="File with one YouTube URL per line; processed concurrently")
     parser.add_argument("--save", action="store_true", help="Save result to outputs/ (or OUTPUT_DIR)")
-    parser.add_argument("--api-key", default=GOOGLE_API_KEY, help="Google API key (optionally override env)")
-    return parser.parse_args()
+    parser.add_argument("--no-cache", action="store_true", help="Always call the API; ignore and don't write OUTPUT_DIR/.cache")
+    parser.add_argument("--api-key", help="Google API key (optionally override env)")
+    return parser
+
+
+def _default_args() -> SimpleNamespace:
+    """
+    What _parser() returns for an empty command line, without importing argparse.
+    Must stay in sync with the options and defaults in _parser().
+    """
+    return SimpleNamespace(
+        youtube_url=None, prompt_type=None, model=None, urls_file=None, save=False, no_cache=False, api_key=None
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        # Everything comes from the environment; no need to build a parser
+        return _default_args()
+    return _parser().parse_args(argv)
 
 
 def main():
     args = parse_args()
-    if not args.youtube_url:
-        print("Error: No YouTube URL provided. Use --youtube-url or set YOUTUBE_URL in .env.", file=sys.stderr)
+    apply_env_defaults(args)
+    if not args.youtube_url and not args.urls_file:
+        print("Error: No YouTube URL provided. Use --youtube-url, --urls-file or set YOUTUBE_URL in .env.", file=sys.stderr)
         sys.exit(1)
 
     prompt_type = args.prompt_type.lower()
     if prompt_type not in PROMPTS:
-        print(f"Error: Unknown prompt type '{prompt_type}'. Valid: {', '.join(PROMPTS.keys())}", file=sys.stderr)
+        print(f"Error: Unknown prompt type '{prompt_type}'. Valid: {', '.join(_PROMPT_KEYS)}", file=sys.stderr)
         sys.exit(1)
 
-    prompt_text = PROMPTS[prompt_type]
-    payload = build_payload(args.model, prompt_text, args.youtube_url)
+    cache_dir = None if args.no_cache else args.output_dir / ".cache"
+    if args.urls_file:
+        main_batch(args, prompt_type, cache_dir)
+        return
 
     print(f"Calling Google model={args.model} for prompt_type={prompt_type} on URL={args.youtube_url}...")
     try:
-        response_json = call_google_generate(args.model, args.api_key, payload)
+        out_text = generate_text(args.model, args.api_key, prompt_type, args.youtube_url, cache_dir)
     except Exception as e:
         print("Error calling Google Generative API:", file=sys.stderr)
         print(str(e), file=sys.stderr)
         sys.exit(2)
 
-    out_text = extract_main_text(response_json)
     print("\n--- Generated Output START ---\n")
     print(out_text)
     print("\n--- Generated Output END ---\n")
 
     if args.save:
-        path = save_output(out_text, prompt_type, OUTPUT_DIR)
+        path = save_output(out_text, prompt_type, args.output_dir)
         print(f"Saved output to: {path}")
 
 
+def main_batch(args, prompt_type: str, cache_dir: Optional[Path]) -> None:
+    try:
+        urls = read_urls_file(args.urls_file)
+    except OSError as e:
+        print(f"Error: Cannot read URLs file: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not urls:
+        print(f"Error: No URLs found in {args.urls_file}.", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Calling Google model={args.model} for prompt_type={prompt_type} on {len(urls)} URLs...")
+    failed = 0
+    for index, (url, out_text, error) in enumerate(run_batch(urls, args.model, args.api_key, prompt_type, cache_dir)):
+        if error is not None:
+            failed += 1
+            print(f"Error calling Google Generative API for URL={url}:", file=sys.stderr)
+            print(str(error), file=sys.stderr)
+            continue
+
+        print(f"\n--- Generated Output START ({url}) ---\n")
+        print(out_text)
+        print(f"\n--- Generated Output END ({url}) ---\n")
+
+        if args.save:
+            path = save_output(out_text, prompt_type, args.output_dir, index)
+            print(f"Saved output to: {path}")
+
+    if failed:
+        print(f"{failed} of {len(urls)} URLs failed.", file=sys.stderr)
+        sys.exit(2)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+freeze_config.py
+
+Snapshot the repository's .env into config_frozen.py so config.py can skip
+dotenv parsing at start-up. Run at deploy time, then set AUTOTUBE_FROZEN_CONFIG=1.
+
+Usage:
+  python tools/freeze_config.py [--env-file PATH] [--output PATH]
+
+The generated file contains secrets (API keys); it is git-ignored and should be
+treated like .env itself.
+"""
+import argparse
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def render(env) -> str:
+    """Render env as a module holding a single ENV dict literal."""
+    lines = [
+        '"""Generated by tools/freeze_config.py from .env -- do not edit."""',
+        "",
+        "ENV = {",
+    ]
+    lines.extend(f"    {key!r}: {value!r}," for key, value in env.items())
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Freeze .env into config_frozen.py")
+    parser.add_argument("--env-file", default=str(ROOT / ".env"), help="Path to the .env file to read")
+    parser.add_argument("--output", default=str(ROOT / "config_frozen.py"), help="Path of the module to write")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    # Keys without a value are skipped, matching load_dotenv()
+    env = {key: value for key, value in dotenv_values(args.env_file).items() if value is not None}
+    Path(args.output).write_text(render(env), encoding="utf-8")
+    print(f"Wrote {len(env)} keys from {args.env_file} to {args.output}")
+
+
+if __name__ == "__main__":
+    main()